@@ -1,5 +1,9 @@
+import sys
 import json
 import time
+import atexit
+import weakref
+import threading
 
 from urllib.parse import urlencode
 from binance.error import (
@@ -8,6 +12,16 @@ from binance.error import (
     ParameterTypeError,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 def cleanNoneValue(d) -> dict:
     out = {}
@@ -62,5 +76,76 @@ def convert_list_to_json_array(symbols):
     return res.replace(" ", "")
 
 
+def json_dumps(obj) -> bytes:
+    """serialize obj to UTF-8 encoded JSON, with orjson if it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf8")
+
+
+json_loads = json.loads if orjson is None else orjson.loads
+
+
+class BufferedJSONSink:
+    """websocket callback writing each message as a line of JSON
+
+    Lines are buffered and written to the binary file `fh` (stdout by
+    default) once more than `buffer_size` bytes are pending, when `flush`
+    is called and at interpreter exit, rather than once per message.
+    The sink can be called and flushed from different threads.
+
+    Messages may be raw `str`/`bytes` frames, decoded JSON values, or
+    msgspec structs such as those produced by the `use_msgspec` decoders.
+    """
+
+    __slots__ = ("_fh", "_text", "_buf", "_buffer_size", "_lock", "__weakref__")
+
+    def __init__(self, fh=None, buffer_size=65536):
+        self._text = False
+        if fh is None:
+            fh = getattr(sys.stdout, "buffer", None)
+            if fh is None:
+                # stdout was replaced with a text-only stream, e.g. in Jupyter
+                fh = sys.stdout
+                self._text = True
+        self._fh = fh
+        self._buf = bytearray()
+        self._buffer_size = buffer_size
+        self._lock = threading.Lock()
+        # a weak reference, so the exit hook doesn't keep the sink alive
+        atexit.register(_flush_sink, weakref.ref(self))
+
+    def __call__(self, message):
+        if isinstance(message, (bytes, bytearray)):
+            line = message
+        elif isinstance(message, str):
+            line = message.encode("utf8")
+        elif msgspec is not None and isinstance(message, msgspec.Struct):
+            line = msgspec.json.encode(message)
+        else:
+            line = json_dumps(message)
+        with self._lock:
+            self._buf += line
+            self._buf += b"\n"
+            if len(self._buf) > self._buffer_size:
+                self._write()
+
+    def flush(self):
+        with self._lock:
+            self._write()
+        self._fh.flush()
+
+    def _write(self):
+        buf, self._buf = self._buf, bytearray()
+        if buf:
+            self._fh.write(buf.decode("utf8") if self._text else buf)
+
+
+def _flush_sink(ref):
+    sink = ref()
+    if sink is not None:
+        sink.flush()
+
+
 def config_logging(logging, logging_devel, log_file=None):
     logging.basicConfig(level=logging_devel, filename=log_file)
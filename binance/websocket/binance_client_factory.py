@@ -1,6 +1,7 @@
 import logging
 from autobahn.twisted.websocket import WebSocketClientFactory
 from twisted.internet.protocol import ReconnectingClientFactory
+from binance.lib.utils import json_loads
 from binance.websocket.binance_client_protocol import BinanceClientProtocol
 
 
@@ -17,6 +18,7 @@ class BinanceClientFactory(WebSocketClientFactory, BinanceReconnectingClientFact
         self.protocol_instance = None
         self.base_client = None
         self.payload = payload
+        self.decode = json_loads
 
     _reconnect_error_payload = {"e": "error", "m": "Max reconnect retries reached"}
 
@@ -1,4 +1,3 @@
-import json
 import logging
 from autobahn.twisted.websocket import WebSocketClientProtocol
 
@@ -23,7 +22,7 @@ class BinanceClientProtocol(WebSocketClientProtocol):
     def onMessage(self, payload, isBinary):
         if not isBinary:
             try:
-                payload_obj = json.loads(payload.decode("utf8"))
+                payload_obj = self.factory.decode(payload)
             except ValueError:
                 pass
             else:
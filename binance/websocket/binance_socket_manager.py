@@ -1,10 +1,10 @@
-import json
 import logging
 import threading
 from urllib.parse import urlparse
-from twisted.internet import reactor, ssl
+from twisted.internet import ssl
 from twisted.internet.error import ReactorAlreadyRunning
 from autobahn.twisted.websocket import WebSocketClientFactory, connectWS
+from binance.lib.utils import json_loads
 from binance.websocket.binance_client_protocol import BinanceClientProtocol
 from binance.websocket.binance_client_factory import BinanceClientFactory
 
@@ -20,9 +20,17 @@ class BinanceSocketManager(threading.Thread):
         self._user_callback = None
 
     def _start_socket(
-        self, stream_name, payload, callback, is_combined=False, is_live=True
+        self,
+        stream_name,
+        payload,
+        callback,
+        is_combined=False,
+        is_live=True,
+        decoder=None,
     ):
-        if stream_name in self._conns:
+        # factories are registered right away, connections only once the
+        # reactor thread has opened them
+        if stream_name in self.factories or stream_name in self._conns:
             return False
 
         if is_combined:
@@ -31,7 +39,7 @@ class BinanceSocketManager(threading.Thread):
             factory_url = self.stream_url + "/ws"
 
         if not is_live:
-            payload_obj = json.loads(payload.decode("utf8"))
+            payload_obj = json_loads(payload)
 
             if is_combined:
                 factory_url = factory_url + "?streams=" + payload_obj["params"]
@@ -48,27 +56,42 @@ class BinanceSocketManager(threading.Thread):
             openHandshakeTimeout=5, autoPingInterval=300, autoPingTimeout=5
         )
         factory.callback = callback
+        if decoder is not None:
+            factory.decode = decoder
         self.factories[stream_name] = factory
+
+        from twisted.internet import reactor
+
         reactor.callFromThread(self.add_connection, stream_name, self.stream_url)
 
     def add_connection(self, stream_name, url):
         if not url.startswith("wss://"):
             raise ValueError("expected wss:// URL prefix")
 
-        factory = self.factories[stream_name]
+        factory = self.factories.get(stream_name)
+        if factory is None:
+            # the stream was closed before the connection got opened
+            return
         options = ssl.optionsForClientTLS(hostname=urlparse(url).hostname)
         self._conns[stream_name] = connectWS(factory, options)
 
     def stop_socket(self, conn_key):
+        self.factories.pop(conn_key, None)
         if conn_key not in self._conns:
             return
 
+        self._disconnect(self._conns.pop(conn_key))
+
+    def _disconnect(self, conn):
         # disable reconnecting if we are closing
-        self._conns[conn_key].factory = WebSocketClientFactory(self.stream_url)
-        self._conns[conn_key].disconnect()
-        del self._conns[conn_key]
+        conn.factory = WebSocketClientFactory(self.stream_url)
+        conn.disconnect()
 
     def run(self):
+        # the reactor is imported lazily so an alternative one (e.g. uvloop)
+        # can still be installed after this module has been imported
+        from twisted.internet import reactor
+
         try:
             reactor.run(installSignalHandlers=False)
         except ReactorAlreadyRunning:
@@ -1,3 +1,4 @@
+from typing import Sequence, Union
 from binance.websocket.websocket_client import BinanceWebsocketClient
 
 
@@ -293,11 +294,18 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
             )
 
     def partial_book_depth(
-        self, symbol: str, id: int, level, speed, callback, **kwargs
+        self,
+        symbol: Union[str, Sequence[str]],
+        id: int,
+        level,
+        speed,
+        callback,
+        **kwargs
     ):
         """Partial Book Depth Streams
 
         Top bids and asks, Valid are 5, 10, or 20.
+        A list or tuple of symbols is subscribed with a single SUBSCRIBE message.
 
         Stream Names: <symbol>@depth<levels> OR <symbol>@depth<levels>@500ms OR <symbol>@depth<levels>@100ms
 
@@ -306,12 +314,12 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         Update Speed: 250ms, 500ms or 100ms
         """
 
-        self.live_subscribe(
-            "{}@depth{}@{}ms".format(symbol.lower(), level, speed),
-            id,
-            callback,
-            **kwargs
-        )
+        if isinstance(symbol, str):
+            stream = "{}@depth{}@{}ms".format(symbol.lower(), level, speed)
+        else:
+            stream = ["{}@depth{}@{}ms".format(s.lower(), level, speed) for s in symbol]
+
+        self.live_subscribe(stream, id, callback, **kwargs)
 
     def diff_book_depth(self, symbol: str, id: int, speed, callback, **kwargs):
         """Diff. Depth Stream
@@ -1,12 +1,105 @@
-from typing import Union, List
+import logging
+from typing import Callable, List, Optional, Sequence, Union
+from binance.error import ParameterValueError
+from binance.lib.utils import json_loads
 from binance.websocket.websocket_client import BinanceWebsocketClient
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_DEPTH_LEVELS = frozenset({5, 10, 20})
+_DEPTH_SPEEDS = frozenset({100, 250, 500})
+_DEPTH_SUFFIX = {
+    (level, speed): f"@depth{level}@{speed}ms"
+    for level in _DEPTH_LEVELS
+    for speed in _DEPTH_SPEEDS
+}
+
+
+def _as_int(value):
+    # only numeric strings are converted, 10.7 or True stay invalid
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return value
+
+
+_DECODERS = {}
+
+if msgspec is not None:
+
+    class BookTicker(msgspec.Struct):
+        e: str
+        u: int
+        E: int
+        T: int
+        s: str
+        b: str
+        B: str
+        a: str
+        A: str
+
+    class AggTrade(msgspec.Struct):
+        e: str
+        E: int
+        s: str
+        a: int
+        p: str
+        q: str
+        f: int
+        l: int  # noqa: E741
+        T: int
+        m: bool
+
+    def _struct_decoder(struct):
+        decoder = msgspec.json.Decoder(struct)
+
+        def decode(payload):
+            try:
+                return decoder.decode(payload)
+            except msgspec.ValidationError:
+                # subscribe responses and errors don't match the stream schema
+                return json_loads(payload)
+
+        return decode
+
+    _DECODERS["bookTicker"] = _struct_decoder(BookTicker)
+    _DECODERS["aggTrade"] = _struct_decoder(AggTrade)
+
 
 class UMFuturesWebsocketClient(BinanceWebsocketClient):
-    def __init__(self, stream_url="wss://fstream.binance.com"):
+    # decode bookTicker and aggTrade messages into msgspec structs, can be
+    # overridden per client with the `use_msgspec` argument
+    use_msgspec = False
+
+    def __init__(
+        self,
+        stream_url: str = "wss://fstream.binance.com",
+        use_msgspec: Optional[bool] = None,
+    ):
         super().__init__(stream_url)
-
-    def agg_trade(self, symbol: str, id: int, callback, **kwargs):
+        self._lower_cache = {}
+        self._decoders = {}
+        if use_msgspec is None:
+            use_msgspec = self.use_msgspec
+        if use_msgspec:
+            if msgspec is None:
+                logging.warning("msgspec is not installed, messages are dicts")
+            self._decoders = _DECODERS
+
+    def _lc(self, s: str) -> str:
+        """lowercase a symbol, caching the result per client"""
+        try:
+            return self._lower_cache[s]
+        except KeyError:
+            lowered = self._lower_cache[s] = s.lower()
+            return lowered
+
+    def agg_trade(self, symbol: str, id: int, callback: Callable, **kwargs):
         """Aggregate Trade Streams
 
         The Aggregate Trade Streams push market trade information that is aggregated for a single taker order every 100 milliseconds.
@@ -17,10 +110,16 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         https://binance-docs.github.io/apidocs/futures/en/#aggregate-trade-streams
 
         Update Speed: 100ms
+
+        With `use_msgspec` enabled and msgspec installed, messages are decoded
+        into `AggTrade` structs of this module instead of dicts.
         """
-        self.live_subscribe(f"{symbol.lower()}@aggTrade", id, callback, **kwargs)
+        kwargs.setdefault("decoder", self._decoders.get("aggTrade"))
+        self.live_subscribe(f"{self._lc(symbol)}@aggTrade", id, callback, **kwargs)
 
-    def mark_price(self, symbol: str, id: int, speed: int, callback, **kwargs):
+    def mark_price(
+        self, symbol: str, id: int, speed: int, callback: Callable, **kwargs
+    ):
         """Mark Price Streams
 
         Mark price and funding rate for all symbols pushed every 3 seconds or every second.
@@ -32,10 +131,10 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         Update Speed: 3000ms or 1000ms
         """
         self.live_subscribe(
-            f"{symbol.lower()}@markPrice@{speed}s", id, callback, **kwargs
+            f"{self._lc(symbol)}@markPrice@{speed}s", id, callback, **kwargs
         )
 
-    def kline(self, symbol: str, id: int, interval: str, callback, **kwargs):
+    def kline(self, symbol: str, id: int, interval: str, callback: Callable, **kwargs):
         """Kline/Candlestick Streams
 
         The Kline/Candlestick Stream push updates to the current klines/candlestick every 250 milliseconds (if existing)
@@ -67,11 +166,17 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
 
         self.live_subscribe(
-            f"{symbol.lower()}@kline_{interval}", id, callback, **kwargs
+            f"{self._lc(symbol)}@kline_{interval}", id, callback, **kwargs
         )
 
     def continuous_kline(
-        self, pair: str, id: int, contractType: str, interval: str, callback, **kwargs
+        self,
+        pair: str,
+        id: int,
+        contractType: str,
+        interval: str,
+        callback: Callable,
+        **kwargs,
     ):
         """Continuous Kline/Candlestick Streams
 
@@ -104,13 +209,15 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
 
         self.live_subscribe(
-            f"{pair.lower()}_{contractType}@continuousKline_{interval}",
+            f"{self._lc(pair)}_{contractType}@continuousKline_{interval}",
             id,
             callback,
             **kwargs,
         )
 
-    def mini_ticker(self, id: int, callback, symbol=None, **kwargs):
+    def mini_ticker(
+        self, id: int, callback: Callable, symbol: Optional[str] = None, **kwargs
+    ):
         """Individual symbol or all symbols mini ticker
 
         24hr rolling window mini-ticker statistics.
@@ -128,9 +235,13 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         if symbol is None:
             self.live_subscribe("!miniTicker@arr", id, callback, **kwargs)
         else:
-            self.live_subscribe(f"{symbol.lower()}@miniTicker", id, callback, **kwargs)
+            self.live_subscribe(
+                f"{self._lc(symbol)}@miniTicker", id, callback, **kwargs
+            )
 
-    def ticker(self, id: int, callback, symbol=None, **kwargs):
+    def ticker(
+        self, id: int, callback: Callable, symbol: Optional[str] = None, **kwargs
+    ):
         """Individual symbol or all symbols ticker
 
         24hr rolling window ticker statistics for a single symbol.
@@ -148,9 +259,11 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         if symbol is None:
             self.live_subscribe("!ticker@arr", id, callback, **kwargs)
         else:
-            self.live_subscribe(f"{symbol.lower()}@ticker", id, callback, **kwargs)
+            self.live_subscribe(f"{self._lc(symbol)}@ticker", id, callback, **kwargs)
 
-    def book_ticker(self, id: int, callback, symbol=None, **kwargs):
+    def book_ticker(
+        self, id: int, callback: Callable, symbol: Optional[str] = None, **kwargs
+    ):
         """Individual symbol or all book ticker
 
         Pushes any update to the best bid or ask's price or quantity in real-time for a specified symbol.
@@ -162,14 +275,22 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         https://binance-docs.github.io/apidocs/futures/en/#all-book-tickers-stream
 
         Update Speed: Real-time
+
+        With `use_msgspec` enabled and msgspec installed, messages are decoded
+        into `BookTicker` structs of this module instead of dicts.
         """
 
+        kwargs.setdefault("decoder", self._decoders.get("bookTicker"))
         if symbol is None:
             self.live_subscribe("!bookTicker", id, callback, **kwargs)
         else:
-            self.live_subscribe(f"{symbol.lower()}@bookTicker", id, callback, **kwargs)
+            self.live_subscribe(
+                f"{self._lc(symbol)}@bookTicker", id, callback, **kwargs
+            )
 
-    def liquidation_order(self, id: int, callback, symbol=None, **kwargs):
+    def liquidation_order(
+        self, id: int, callback: Callable, symbol: Optional[str] = None, **kwargs
+    ):
         """The Liquidation Order Snapshot Streams push force liquidation order information for specific symbol.
         The All Liquidation Order Snapshot Streams push force liquidation order information for all symbols in the market.
 
@@ -186,9 +307,19 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         if symbol is None:
             self.live_subscribe("!forceOrder@arr", id, callback, **kwargs)
         else:
-            self.live_subscribe(f"{symbol.lower()}@forceOrder", id, callback, **kwargs)
-
-    def partial_book_depth(self, symbols: Union[str, List[str]], id: int, level: int, speed: int, callback, **kwargs):
+            self.live_subscribe(
+                f"{self._lc(symbol)}@forceOrder", id, callback, **kwargs
+            )
+
+    def partial_book_depth(
+        self,
+        symbols: Union[str, Sequence[str]],
+        id: int,
+        level: int,
+        speed: int,
+        callback: Callable,
+        **kwargs,
+    ):
         """Subscribe to partial book depth streams for a symbol.
 
         Valid levels are 5, 10, or 20. The update speed can be 250ms, 500ms, or 100ms.
@@ -197,23 +328,58 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         See https://binance-docs.github.io/apidocs/futures/en/#partial-book-depth-streams for more information.
 
         Args:
-            symbol (Union[str, List[str]]): A single symbol or a list of symbols to subscribe to.
+            symbols (Union[str, Sequence[str]]): A single symbol or a list/tuple of symbols to subscribe to.
             id (int): The subscription ID.
             level (int): The depth level to subscribe to.
             speed (int): The update speed in milliseconds.
             callback: The callback function to call when an update is received.
             **kwargs: Additional arguments to pass to the callback function.
 
-        """
-        if isinstance(symbols, list):
-            streams = [f"{s.lower()}@depth{level}@{speed}ms" for s in symbols]
-        else:
-            streams = f"{symbols.lower()}@depth{level}@{speed}ms"
+        Raises:
+            ParameterValueError: If level or speed is not one of the valid values.
 
+        """
+        streams = self._partial_book_depth_streams(symbols, level, speed)
         self.live_subscribe(streams, id, callback, **kwargs)
 
+    async def async_partial_book_depth(
+        self,
+        symbols: Union[str, Sequence[str]],
+        id: int,
+        level: int,
+        speed: int,
+        **kwargs,
+    ):
+        """Subscribe to partial book depth streams and return an asyncio.Queue
 
-    def diff_book_depth(self, symbol: str, id: int, speed, callback, **kwargs):
+        Same streams as `partial_book_depth`, but the messages are put on the
+        returned queue instead of being passed to a callback.
+        See `async_subscribe` for the queue semantics.
+        """
+        streams = self._partial_book_depth_streams(symbols, level, speed)
+        return await self.async_subscribe(streams, id, **kwargs)
+
+    def _partial_book_depth_streams(
+        self, symbols: Union[str, Sequence[str]], level: int, speed: int
+    ) -> Union[str, List[str]]:
+        suffix = _DEPTH_SUFFIX.get((level, speed))
+        if suffix is None:
+            # numeric strings such as "100" built a valid stream before
+            level, speed = _as_int(level), _as_int(speed)
+            suffix = _DEPTH_SUFFIX.get((level, speed))
+        if suffix is None:
+            if level not in _DEPTH_LEVELS:
+                raise ParameterValueError([f"level={level!r}"])
+            raise ParameterValueError([f"speed={speed!r}"])
+
+        # a single symbol keeps the raw stream, any sequence is combined
+        if isinstance(symbols, str):
+            return self._lc(symbols) + suffix
+        return [self._lc(s) + suffix for s in symbols]
+
+    def diff_book_depth(
+        self, symbol: str, id: int, speed: int, callback: Callable, **kwargs
+    ):
         """Diff. Depth Stream
         Order book price and quantity depth updates used to locally manage an order book.
 
@@ -225,10 +391,10 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
 
         self.live_subscribe(
-            f"{symbol.lower()}@depth@{speed}ms", id, callback, **kwargs
+            f"{self._lc(symbol)}@depth@{speed}ms", id, callback, **kwargs
         )
 
-    def composite_index(self, symbol: str, id: int, callback, **kwargs):
+    def composite_index(self, symbol: str, id: int, callback: Callable, **kwargs):
         """Composite Index Info Stream
         Composite index information for index symbols pushed every second.
 
@@ -239,8 +405,10 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         Update Speed: 1000ms
         """
 
-        self.live_subscribe(f"{symbol.lower()}@compositeIndex", id, callback, **kwargs)
+        self.live_subscribe(
+            f"{self._lc(symbol)}@compositeIndex", id, callback, **kwargs
+        )
 
-    def user_data(self, listen_key: str, id: int, callback, **kwargs):
+    def user_data(self, listen_key: str, id: int, callback: Callable, **kwargs):
         """listen to user data by provided listenkey"""
         self.live_subscribe(listen_key, id, callback, **kwargs)
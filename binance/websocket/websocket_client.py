@@ -1,17 +1,65 @@
-import json
-from twisted.internet import reactor
+import sys
+import asyncio
+import logging
+from collections import deque
+from binance.error import ClientError, ServerError
+from binance.lib.utils import json_dumps
+from binance.websocket.binance_client_factory import BinanceClientFactory
 from binance.websocket.binance_socket_manager import BinanceSocketManager
 
 
 class BinanceWebsocketClient(BinanceSocketManager):
+    # run the Twisted reactor on top of uvloop when the client is created
+    use_uvloop = False
+    # the server accepts at most 200 streams on a single connection
+    max_streams_per_connection = 200
+
     def __init__(self, stream_url):
+        if self.use_uvloop:
+            self.install_uvloop()
         super().__init__(stream_url)
+        self._async_queues = {}
+        self._stopped = False
 
-    def stop(self):
+    @classmethod
+    def install_uvloop(cls):
+        """Install the Twisted asyncio reactor backed by a uvloop event loop
+
+        This has to be called before the reactor is first used, i.e. before
+        any client is started. Returns False if uvloop is not available or
+        another reactor has already been installed. The global asyncio event
+        loop policy is not changed.
+        """
         try:
-            self.close()
-        finally:
-            reactor.stop()
+            import uvloop
+        except ImportError:
+            logging.warning("uvloop is not installed, using the default reactor")
+            return False
+
+        from twisted.internet import asyncioreactor
+        from twisted.internet.error import ReactorAlreadyInstalledError
+
+        installed = sys.modules.get("twisted.internet.reactor")
+        if isinstance(installed, asyncioreactor.AsyncioSelectorReactor) and isinstance(
+            installed._asyncioEventloop, uvloop.Loop
+        ):
+            return True
+
+        try:
+            asyncioreactor.install(uvloop.new_event_loop())
+        except ReactorAlreadyInstalledError:
+            logging.warning("A reactor is already installed, uvloop is not used")
+            return False
+        return True
+
+    def stop(self):
+        from twisted.internet import reactor
+
+        # the reactor runs in the client thread, so both calls are handed over
+        # to it; calling reactor.stop() from here doesn't wake it up
+        self._stopped = True
+        reactor.callFromThread(self.close)
+        reactor.callFromThread(reactor.stop)
 
     def _single_stream(self, stream):
         if isinstance(stream, str):
@@ -21,7 +69,16 @@ class BinanceWebsocketClient(BinanceSocketManager):
         else:
             raise ValueError("Invalid stream name, expect string or array")
 
-    def live_subscribe(self, stream, id, callback, **kwargs):
+    def _stream_shards(self, stream):
+        """split a list of streams into lists that fit on one connection"""
+        limit = self.max_streams_per_connection
+        shards = []
+        for start in range(0, len(stream), limit):
+            end = start + limit
+            shards.append(stream[start:end])
+        return shards
+
+    def live_subscribe(self, stream, id, callback, decoder=None, **kwargs):
         """live subscribe websocket
         Connect to the server
         - UM Futures: wss://fstream.binance.com/ws
@@ -33,20 +90,38 @@ class BinanceWebsocketClient(BinanceSocketManager):
 
         {"method": "SUBSCRIBE","params":["btcusdt@miniTicker"],"id": 100}
 
+        decoder, if given, is called with the raw bytes of every message
+        instead of the default JSON decoding.
+
+        A list of more than `max_streams_per_connection` streams is spread
+        over several connections, all delivering to the same callback.
         """
         combined = False
         if self._single_stream(stream):
             stream = [stream]
         else:
             combined = True
+            if len(stream) > self.max_streams_per_connection:
+                results = [
+                    self.live_subscribe(shard, id, callback, decoder=decoder, **kwargs)
+                    for shard in self._stream_shards(stream)
+                ]
+                if False in results:
+                    return False
+                return
 
         data = {"method": "SUBSCRIBE", "params": stream, "id": id}
 
         data.update(**kwargs)
-        payload = json.dumps(data, ensure_ascii=False).encode("utf8")
+        payload = json_dumps(data)
         stream_name = "-".join(stream)
         return self._start_socket(
-            stream_name, payload, callback, is_combined=combined, is_live=True
+            stream_name,
+            payload,
+            callback,
+            is_combined=combined,
+            is_live=True,
+            decoder=decoder,
         )
 
     def instant_subscribe(self, stream, callback, **kwargs):
@@ -63,8 +138,172 @@ class BinanceWebsocketClient(BinanceSocketManager):
         data = {"method": "SUBSCRIBE", "params": stream}
 
         data.update(**kwargs)
-        payload = json.dumps(data, ensure_ascii=False).encode("utf8")
+        payload = json_dumps(data)
         stream_name = "-".join(stream)
         return self._start_socket(
             stream_name, payload, callback, is_combined=combined, is_live=False
         )
+
+    async def async_subscribe(self, stream, id, maxsize=1024, **kwargs):
+        """live subscribe websocket and consume the messages from asyncio
+
+        Sends the same subscribe message as `live_subscribe`, waits for the
+        server to acknowledge it and returns an `asyncio.Queue` the messages
+        are put on. When the queue is full the oldest message is dropped.
+        `None` is put on the queue once the stream is closed by `aclose`.
+
+        Raises `ValueError` if the stream list is empty or already subscribed,
+        `ClientError` if the server rejects the subscription and `ServerError`
+        if the connection can't be established. The connections opened by a
+        failed or cancelled call are closed again.
+        The client thread has to be started before calling this method.
+        """
+        if self._single_stream(stream):
+            shards = [stream]
+        else:
+            shards = self._stream_shards(stream)
+        if not shards:
+            raise ValueError("Invalid stream name, expect at least one stream")
+
+        subscription = _AsyncSubscription(asyncio.get_running_loop(), id, maxsize)
+        started = []
+        try:
+            self._start_async_shards(shards, subscription, started, **kwargs)
+            await subscription.ack
+        except BaseException:
+            self._drop_async_streams(started)
+            raise
+        return subscription.queue
+
+    def _start_async_shards(self, shards, subscription, started, **kwargs):
+        # a sharded subscription is acknowledged once per connection
+        subscription.acks_left = len(shards)
+        for shard in shards:
+            stream_name = shard if isinstance(shard, str) else "-".join(shard)
+            result = self.live_subscribe(
+                shard, subscription.id, subscription.callback, **kwargs
+            )
+            if result is False:
+                raise ValueError(f"{stream_name} is already subscribed")
+            self._async_queues[stream_name] = subscription.queue
+            started.append(stream_name)
+
+    def _drop_async_streams(self, stream_names):
+        from twisted.internet import reactor
+
+        for stream_name in stream_names:
+            self._async_queues.pop(stream_name, None)
+            # unregistered right away so the stream can be subscribed again,
+            # only the disconnect is left to the reactor thread
+            self.factories.pop(stream_name, None)
+            conn = self._conns.pop(stream_name, None)
+            if conn is not None:
+                reactor.callFromThread(self._disconnect, conn)
+
+    async def aclose(self):
+        """close the streams opened by `async_subscribe`
+
+        Waits until the connections are closed by the reactor thread, then
+        puts `None` on every queue to tell the consumers the stream ended.
+        If the client was never started or has been stopped, the connections
+        are closed right away.
+        """
+        from twisted.internet import reactor
+
+        queues, self._async_queues = self._async_queues, {}
+
+        def stop_sockets():
+            for stream_name in queues:
+                self.stop_socket(stream_name)
+
+        if self._stopped or not self.is_alive() or not reactor.running:
+            stop_sockets()
+        else:
+            loop = asyncio.get_running_loop()
+            closed = loop.create_future()
+
+            def stop_sockets_and_notify():
+                stop_sockets()
+                loop.call_soon_threadsafe(closed.set_result, None)
+
+            reactor.callFromThread(stop_sockets_and_notify)
+            await closed
+
+        for queue in set(queues.values()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+
+class _AsyncSubscription:
+    """hands the messages of one `async_subscribe` call over to asyncio"""
+
+    # bound of the reactor side buffer when the queue itself is unbounded
+    max_pending = 8192
+
+    def __init__(self, loop, id, maxsize):
+        self.loop = loop
+        self.id = id
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.ack = loop.create_future()
+        self.acks_left = 0
+        # data frames from the reactor thread are buffered and handed over in
+        # batches, so a burst of frames wakes the event loop only once. The
+        # buffer drops its oldest frames, like the queue, while the event loop
+        # is busy; control frames never go through it so they can't be lost
+        self._pending = deque(maxlen=maxsize if maxsize > 0 else self.max_pending)
+        self._drain_scheduled = False
+
+    def callback(self, message):
+        """websocket callback, runs in the reactor thread"""
+        if self._is_control(message):
+            self.loop.call_soon_threadsafe(self._on_async_ack, message)
+            return
+        self._pending.append(message)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.loop.call_soon_threadsafe(self._drain)
+
+    def _is_control(self, message):
+        if not isinstance(message, dict):
+            return False
+        if message.get("id") == self.id:
+            return "result" in message or "error" in message
+        return message == BinanceClientFactory._reconnect_error_payload
+
+    def _drain(self):
+        self._drain_scheduled = False
+        while self._pending:
+            self._put(self._pending.popleft())
+
+    def _on_async_ack(self, message):
+        """handle a control frame, runs in the event loop
+
+        Subscribe responses are never queued, including the ones sent again
+        after a reconnect, when the ack is already resolved.
+        """
+        if message.get("id") == self.id:
+            if not self.ack.done():
+                self._resolve_ack(message)
+        elif not self.ack.done():
+            # the connection could not be established
+            self.ack.set_exception(ServerError(None, message["m"]))
+        else:
+            # the connection was lost for good, let the consumer know
+            self._put(message)
+
+    def _resolve_ack(self, message):
+        if "error" in message:
+            error = message["error"]
+            self.ack.set_exception(
+                ClientError(None, error.get("code"), error.get("msg"), None)
+            )
+            return
+        self.acks_left -= 1
+        if not self.acks_left:
+            self.ack.set_result(message["result"])
+
+    def _put(self, message):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
@@ -1,29 +1,51 @@
 #!/usr/bin/env python
 
-import time
+import asyncio
 import logging
-from binance.lib.utils import config_logging
+from binance.lib.utils import config_logging, BufferedJSONSink
 from binance.websocket.um_futures.websocket_client import UMFuturesWebsocketClient
 
 config_logging(logging, logging.DEBUG)
 
+# writes one JSON line per message, in 64 KiB chunks instead of print per message
+message_handler = BufferedJSONSink()
 
-def message_handler(message):
-    print(message)
 
+async def queue_iter(queue):
+    # the client puts None on the queue once the stream is closed
+    while True:
+        message = await queue.get()
+        if message is None:
+            return
+        yield message
 
-my_client = UMFuturesWebsocketClient()
-my_client.start()
 
-my_client.partial_book_depth(
-    symbols=["bnbusdt", "btcusdt", "ethusdt"],
-    id=1,
-    level=10,
-    speed=100,
-    callback=message_handler,
-)
+async def consume(my_client):
+    queue = await my_client.async_partial_book_depth(
+        symbols=["bnbusdt", "btcusdt", "ethusdt"],
+        id=1,
+        level=10,
+        speed=100,
+    )
+    async for message in queue_iter(queue):
+        message_handler(message)
 
-time.sleep(10)
 
-logging.debug("closing ws connection")
-my_client.stop()
+async def main():
+    my_client = UMFuturesWebsocketClient()
+    my_client.start()
+
+    try:
+        await asyncio.wait_for(consume(my_client), timeout=10)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        logging.debug("closing ws connection")
+        await my_client.aclose()
+        my_client.stop()
+
+
+# optional, requires `pip install uvloop`
+UMFuturesWebsocketClient.install_uvloop()
+
+asyncio.run(main())
@@ -36,6 +36,9 @@ setup(
     url=URL,
     keywords=["Binance futures", "Public API"],
     install_requires=[req for req in requirements],
+    extras_require={
+        "speedups": ["orjson", "msgspec", 'uvloop; sys_platform != "win32"']
+    },
     packages=find_packages(exclude=("tests",)),
     classifiers=[
         "Intended Audience :: Developers",